@@ -16,14 +16,32 @@ Further enchanced by Filip SP5FLP 2017-2025
 link = ">https://github.com/filipsPL/aprs-is-wx 2025.04.03"
 
 import sys
+import argparse
 import os
 import time
+import math
+import random
 import json
 import logging
-from datetime import datetime, timedelta
-from socket import *
+import http.client
+from datetime import datetime
+from socket import (
+    socket,
+    getaddrinfo,
+    AF_INET,
+    SOCK_STREAM,
+    SHUT_RDWR,
+    IPPROTO_TCP,
+    TCP_NODELAY,
+    timeout as SocketTimeout,
+)
 import configparser
 
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    tomllib = None
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -32,6 +50,31 @@ logging.basicConfig(
     handlers=[logging.StreamHandler(sys.stdout)],
 )
 
+# Shortest allowed time between weather packets in daemon mode, in seconds
+MIN_INTERVAL = 60
+
+# Time between link beacons in daemon mode, in seconds
+LINK_INTERVAL = 30 * 60
+
+# Configuration files looked up by default, in order of preference
+CONFIG_FILES = ("aprs-is-wx.toml", "aprs-is-wx.ini")
+
+# Weather fields reported in APRS packets
+WX_FIELDS = ("temperature", "pressure", "humidity", "wind_dir", "wind_speed", "wind_gust", "rain_since_midnight")
+
+# Unit conversion factors to APRS units (mph, hPa, inches), keyed by lowercase unit name.
+# Unknown units are passed through unconverted.
+WIND_FACTOR = {"m/s": 2.23694, "km/h": 0.621371, "mph": 1.0}
+PRESSURE_FACTOR = {"inhg": 33.8639, "hpa": 1.0}
+RAIN_FACTOR = {"mm": 0.0393701, "in": 1.0}
+
+# Parsed config and weather data, keyed by path and invalidated on file mtime change
+_CONFIG_CACHE = {}
+_METEO_CACHE = {}
+
+# Resolved APRS-IS server addresses, keyed by (host, port)
+_ADDRINFO_CACHE = {}
+
 
 def get_wx_data(json_file, elevation=0):
     """
@@ -50,19 +93,18 @@ def get_wx_data(json_file, elevation=0):
         ValueError: If the data cannot be parsed
     """
     try:
+        cache_key = (json_file, elevation)
+        mtime = os.path.getmtime(json_file)
+        cached = _METEO_CACHE.get(cache_key)
+        if cached and cached[0] == mtime:
+            logging.debug("Using cached weather data from %s", json_file)
+            return cached[1]
+
         with open(json_file, "r") as f:
             weather_data = json.load(f)
 
         # Initialize APRS-compatible data dictionary with all fields as None
-        aprs_data = {
-            "temperature": None,
-            "pressure": None,
-            "humidity": None,
-            "wind_dir": None,
-            "wind_speed": None,
-            "wind_gust": None,
-            "rain_since_midnight": None,
-        }
+        aprs_data = dict.fromkeys(WX_FIELDS)
 
         # Process temperature if available
         if "temperature" in weather_data:
@@ -74,20 +116,18 @@ def get_wx_data(json_file, elevation=0):
 
         # Process pressure if available
         if "pressure" in weather_data:
-            p = float(weather_data["pressure"])
-            pressure_unit = weather_data.get("pressure_unit", "hPa").lower()
-
             # Convert to hPa if needed
-            if pressure_unit == "inhg":
-                p = p * 33.8639
+            pressure_unit = weather_data.get("pressure_unit", "hPa").lower()
+            p = float(weather_data["pressure"]) * PRESSURE_FACTOR.get(pressure_unit, 1.0)
 
             # Apply elevation correction if elevation is provided
+            # p * (1 + k / p^0.19028)^5.2553, evaluated with exp/log instead of pow
             if elevation > 0:
-                p = p * pow((1.0 + 0.000084229 * (elevation / pow(p, 0.19028))), 5.2553)
+                k = 0.000084229 * elevation
+                p = p * math.exp(5.2553 * math.log1p(k * math.exp(-0.19028 * math.log(p))))
 
             # Convert to tenths of hPa for APRS
-            p = int(float(p) * 10)
-            aprs_data["pressure"] = p
+            aprs_data["pressure"] = int(p * 10)
 
         # Process humidity if available
         if "humidity" in weather_data:
@@ -97,69 +137,58 @@ def get_wx_data(json_file, elevation=0):
         if "wind_direction" in weather_data:
             aprs_data["wind_dir"] = int(weather_data["wind_direction"])
 
-        # Process wind speed if available
-        if "wind_speed" in weather_data:
-            wind_speed = float(weather_data["wind_speed"])
-            wind_unit = weather_data.get("wind_speed_unit", "mph").lower()
-
-            # Convert to mph if needed
-            if wind_unit == "m/s":
-                wind_speed = wind_speed * 2.23694
-            elif wind_unit == "km/h":
-                wind_speed = wind_speed * 0.621371
-
-            aprs_data["wind_speed"] = wind_speed
-
-        # Process wind gust if available
-        if "wind_gust" in weather_data:
-            wind_gust = float(weather_data["wind_gust"])
-            gust_unit = weather_data.get("wind_gust_unit", weather_data.get("wind_speed_unit", "mph")).lower()
-
-            # Convert to mph if needed
-            if gust_unit == "m/s":
-                wind_gust = wind_gust * 2.23694
-            elif gust_unit == "km/h":
-                wind_gust = wind_gust * 0.621371
+        # Process wind speed and gust if available, converting to mph
+        wind_speed_unit = weather_data.get("wind_speed_unit", "mph")
+        for key, unit_key in (("wind_speed", "wind_speed_unit"), ("wind_gust", "wind_gust_unit")):
+            if key in weather_data:
+                # Gust falls back to the wind speed unit
+                unit = weather_data.get(unit_key, wind_speed_unit).lower()
+                aprs_data[key] = float(weather_data[key]) * WIND_FACTOR.get(unit, 1.0)
 
-            aprs_data["wind_gust"] = wind_gust
-
-        # Process rainfall if available
+        # Process rainfall if available, converting to inches
         if "rain_since_midnight" in weather_data:
-            rain = float(weather_data["rain_since_midnight"])
             rain_unit = weather_data.get("rain_unit", "in").lower()
-
-            # Convert to inches if needed
-            if rain_unit == "mm":
-                rain = rain * 0.0393701
-
-            aprs_data["rain_since_midnight"] = rain
+            rain = float(weather_data["rain_since_midnight"])
+            aprs_data["rain_since_midnight"] = rain * RAIN_FACTOR.get(rain_unit, 1.0)
 
         # Log available weather data
-        available_data = [k for k, v in aprs_data.items() if v is not None]
-        logging.debug(f"Available weather data: {', '.join(available_data)}")
-        logging.debug(f"Processed weather data: {aprs_data}")
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            available_data = [k for k, v in aprs_data.items() if v is not None]
+            logging.debug("Available weather data: %s", ", ".join(available_data))
+            logging.debug("Processed weather data: %s", aprs_data)
 
-        logging.info(f"APRS WX dictionary: {aprs_data}")
+        logging.info("APRS WX dictionary: %s", aprs_data)
+        _METEO_CACHE[cache_key] = (mtime, aprs_data)
         return aprs_data
 
     except FileNotFoundError:
-        logging.error(f"Weather data file {json_file} not found")
+        logging.error("Weather data file %s not found", json_file)
         raise
     except json.JSONDecodeError as e:
-        logging.error(f"Error parsing JSON data: {e}")
+        logging.error("Error parsing JSON data: %s", e)
         raise ValueError(f"Invalid JSON format in {json_file}")
     except Exception as e:
-        logging.error(f"Error processing weather data: {e}")
+        logging.error("Error processing weather data: %s", e)
         # Return empty data with all fields None if there's an error
-        return {
-            "temperature": None,
-            "pressure": None,
-            "humidity": None,
-            "wind_dir": None,
-            "wind_speed": None,
-            "wind_gust": None,
-            "rain_since_midnight": None,
-        }
+        return dict.fromkeys(WX_FIELDS)
+
+
+# APRS field formatters: zero-padded value, or dots if the field is missing.
+# Field widths and types are fixed by the packet layout, so each slot gets its own.
+def _fmt3i(x):
+    return "..." if x is None else f"{x:03d}"
+
+
+def _fmt3f(x):
+    return "..." if x is None else f"{x:03.0f}"
+
+
+def _fmt2f(x):
+    return ".." if x is None else f"{x:02.0f}"
+
+
+def _fmt5i(x):
+    return "....." if x is None else f"{x:05d}"
 
 
 def make_aprs_wx(config, weather_data):
@@ -173,92 +202,113 @@ def make_aprs_wx(config, weather_data):
     Returns:
         str: Formatted APRS weather packet string
     """
-
-    def str_or_dots(number, length):
-        """
-        Format a number with zero-padding or dots if None.
-
-        Args:
-            number: Number to format or None
-            length (int): Length of the resulting string
-
-        Returns:
-            str: Formatted string
-        """
-        if number is None:
-            return "." * length
-
-        if isinstance(number, int):
-            format_type = "d"
-        elif isinstance(number, float):
-            format_type = ".0f"
-        else:
-            raise TypeError(f"Unsupported type for APRS formatting: {type(number)}")
-
-        return f"{number:{format_type}}".zfill(length)
+    wd = weather_data
 
     # Get the HHMMZ time string in Zulu/UTC
-    timeStringZulu = time.strftime("%d%H%M")
-
-    # Convert decimal coordinates to APRS format
-    lat_str, lon_str = convert_coordinates_to_aprs_format(config["STATIONLATITUDE"], config["STATIONLONGITUDE"])
-
-    wx_packet = "@%sz%s/%s_%s/%sg%st%sP%sh%sb%s%s" % (
-        timeStringZulu,
-        lat_str,
-        lon_str,
-        str_or_dots(weather_data.get("wind_dir"), 3),
-        str_or_dots(weather_data.get("wind_speed"), 3),
-        str_or_dots(weather_data.get("wind_gust"), 3),
-        str_or_dots(weather_data.get("temperature"), 3),
-        str_or_dots(weather_data.get("rain_since_midnight"), 3),
-        str_or_dots(weather_data.get("humidity"), 2),
-        str_or_dots(weather_data.get("pressure"), 5),
-        config["STATION_TYPE"],
+    timeStringZulu = time.strftime("%d%H%M", time.gmtime())
+
+    # Station position in APRS format is precomputed in load_config
+    wx_packet = (
+        f"@{timeStringZulu}z{config['APRS_POSITION']}"
+        f"_{_fmt3i(wd.get('wind_dir'))}"
+        f"/{_fmt3f(wd.get('wind_speed'))}"
+        f"g{_fmt3f(wd.get('wind_gust'))}"
+        f"t{_fmt3f(wd.get('temperature'))}"
+        f"P{_fmt3f(wd.get('rain_since_midnight'))}"
+        f"h{_fmt2f(wd.get('humidity'))}"
+        f"b{_fmt5i(wd.get('pressure'))}"
+        f"{config['STATION_TYPE']}"
     )
 
-    logging.debug(f"Created APRS packet: {wx_packet}")
+    logging.debug("Created APRS packet: %s", wx_packet)
     return wx_packet
 
 
-# Load configuration from ini file
-def load_config(config_file="aprs-is-wx.ini"):
+# Load configuration from toml or ini file
+def load_config(config_file=None):
     """
-    Load configuration settings from an INI file.
+    Load configuration settings from a TOML or INI file.
+
+    Files ending in ".toml" are read with tomllib (Python 3.11+), any other
+    file is read as INI.
 
     Args:
-        config_file (str): Path to the configuration file
+        config_file (str, optional): Path to the configuration file. Defaults to the
+            first existing file of CONFIG_FILES; TOML files are skipped if tomllib
+            is not available.
 
     Returns:
         dict: Dictionary containing configuration settings
 
     Raises:
         FileNotFoundError: If the configuration file doesn't exist
-        configparser.Error: If there's an error parsing the configuration
+        configparser.Error: If there's an error parsing the INI configuration
+        ValueError: If the TOML configuration is invalid or can't be read
+        KeyError: If a required setting is missing
     """
+    if config_file is None:
+        candidates = [f for f in CONFIG_FILES if tomllib is not None or not f.endswith(".toml")]
+        config_file = next((f for f in candidates if os.path.exists(f)), candidates[-1])
+
     try:
-        config = configparser.ConfigParser()
-        config.read(config_file)
+        mtime = os.path.getmtime(config_file)
+        cached = _CONFIG_CACHE.get(config_file)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        if config_file.endswith(".toml"):
+            if tomllib is None:
+                raise ValueError(f"Reading {config_file} requires Python 3.11+, use an INI file instead")
+            try:
+                with open(config_file, "rb") as f:
+                    config = tomllib.load(f)
+            except tomllib.TOMLDecodeError as e:
+                raise ValueError(f"Invalid TOML format in {config_file}: {e}")
+        else:
+            config = configparser.ConfigParser()
+            config.read(config_file)
+
+        # TOML tables and INI sections are both read as mappings; values are
+        # coerced so that INI strings and TOML typed values end up the same
+        station = config["Station"]
+        aprs = config["APRS"]
 
         settings = {
-            "ELEVATION": config.getfloat("Station", "elevation"),
-            "STATIONLATITUDE": config.getfloat("Station", "lat"),
-            "STATIONLONGITUDE": config.getfloat("Station", "lon"),
-            "STATION_TYPE": config.get("Station", "type"),
-            "METEO_FILE": config.get("Station", "meteo_json"),
-            "APRS_HOST": config.get("APRS", "host"),
-            "APRS_PORT": config.getint("APRS", "port"),
-            "APRS_USER": config.get("APRS", "user"),
-            "APRS_PASS": config.get("APRS", "pass"),
-            "CALLSIGN": config.get("APRS", "callsign"),
+            "ELEVATION": float(station["elevation"]),
+            "STATIONLATITUDE": float(station["lat"]),
+            "STATIONLONGITUDE": float(station["lon"]),
+            "STATION_TYPE": str(station["type"]),
+            "METEO_FILE": str(station["meteo_json"]),
+            "APRS_HOST": str(aprs["host"]),
+            "APRS_PORT": int(aprs["port"]),
+            "APRS_HTTP_PORT": int(aprs.get("http_port", 8080)),
+            "APRS_USER": str(aprs["user"]),
+            "APRS_PASS": str(aprs["pass"]),
+            "CALLSIGN": str(aprs["callsign"]),
         }
 
+        # Station position never changes, so convert it to APRS format only once
+        settings["LAT_STR"], settings["LON_STR"] = convert_coordinates_to_aprs_format(
+            settings["STATIONLATITUDE"], settings["STATIONLONGITUDE"]
+        )
+        settings["APRS_POSITION"] = f"{settings['LAT_STR']}/{settings['LON_STR']}"
+
+        # Login line and packet header are constant, so encode them only once
+        settings["LOGIN_BYTES"] = (
+            f"user {settings['APRS_USER']} pass {settings['APRS_PASS']} vers aprs-is-wx.py 1.0\n".encode()
+        )
+        settings["CALLSIGN_PREFIX_BYTES"] = f"{settings['CALLSIGN']}>APRS:".encode()
+
+        _CONFIG_CACHE[config_file] = (mtime, settings)
         return settings
     except FileNotFoundError:
-        logging.error(f"Configuration file {config_file} not found")
+        logging.error("Configuration file %s not found", config_file)
         raise
-    except configparser.Error as e:
-        logging.error(f"Error parsing configuration: {e}")
+    except (configparser.Error, ValueError) as e:
+        logging.error("Error parsing configuration: %s", e)
+        raise
+    except KeyError as e:
+        logging.error("Missing configuration setting: %s", e)
         raise
 
 
@@ -290,67 +340,320 @@ def convert_coordinates_to_aprs_format(lat, lon):
     return (lat_str, lon_str)
 
 
-def send_aprs_with_retry(config, wx, max_retries=3, retry_delay=5):
+def connect_aprs(config):
     """
-    Send APRS packet with retry mechanism.
+    Connect to one of the addresses the APRS-IS host name resolves to.
+
+    Rotate DNS names such as rotate.aprs2.net resolve to several servers,
+    so the addresses are tried in random order until one accepts. The resolved
+    addresses are cached in _ADDRINFO_CACHE to avoid repeated DNS lookups.
 
     Args:
         config (dict): Configuration containing APRS server information
-        wx (str): APRS weather packet or status message
-        max_retries (int): Maximum number of connection retries
-        retry_delay (int): Delay between retries in seconds
 
     Returns:
-        bool: True if sending was successful, False otherwise
+        socket: Connected socket
+
+    Raises:
+        OSError: If no address could be connected to
     """
     host = config["APRS_HOST"]
     port = config["APRS_PORT"]
-    user = config["APRS_USER"]
-    passcode = config["APRS_PASS"]
+
+    addrs = _ADDRINFO_CACHE.get((host, port))
+    if not addrs:
+        addrs = getaddrinfo(host, port, AF_INET, SOCK_STREAM, IPPROTO_TCP)
+        random.shuffle(addrs)
+        _ADDRINFO_CACHE[(host, port)] = addrs
+
+    last_error = None
+    for family, socktype, proto, _, sockaddr in addrs:
+        s = socket(family, socktype, proto)
+        s.settimeout(30)  # Set timeout to 30 seconds
+        try:
+            s.connect(sockaddr)
+            return s
+        except (SocketTimeout, OSError) as e:
+            logging.warning("Could not connect to %s:%s: %s", sockaddr[0], sockaddr[1], e)
+            s.close()
+            last_error = e
+
+    raise last_error or OSError(f"No addresses found for {host}")
+
+
+def wait_for_server_ack(s, callsign, expected=1, ack_timeout=3.0):
+    """
+    Read server lines until the packets are echoed back or the deadline passes.
+
+    APRS-IS servers answer the login with a "# logresp ..." line and usually
+    echo injected packets back to the client, so we can close the connection
+    as soon as the callsign shows up instead of waiting a fixed time.
+
+    Args:
+        s (socket): Connected and logged-in APRS-IS socket
+        callsign (str): Callsign used as the packet source
+        expected (int): Number of echoed packets to wait for
+        ack_timeout (float): Maximum time to wait for the acknowledgement in seconds
+
+    Returns:
+        bool: True if the server echoed all packets, False if the deadline passed
+    """
+    # Match the packet header, not the "# logresp <user> ..." login line
+    marker = f"{callsign}>".encode()
+    received = b""
+    deadline = time.monotonic() + ack_timeout
+
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        s.settimeout(remaining)
+        try:
+            data = s.recv(4096)
+        except SocketTimeout:
+            break
+        if not data:
+            # Server closed the connection
+            break
+        received += data
+        if received.count(marker) >= expected:
+            logging.debug("Server acknowledged packets: %r", received)
+            return True
+
+    logging.debug("No acknowledgement from server within %s seconds", ack_timeout)
+    return False
+
+
+def send_aprs_with_retry(config, packets, max_retries=3, retry_delay=5):
+    """
+    Send a batch of APRS packets over a single connection with retry mechanism.
+
+    Args:
+        config (dict): Configuration containing APRS server information
+        packets (list): APRS weather packets and/or status messages
+        max_retries (int): Maximum number of connection retries
+        retry_delay (int): Base delay between retries in seconds, doubled on each attempt
+
+    Returns:
+        bool: True if sending was successful, False otherwise
+    """
     callsign = config["CALLSIGN"]
 
     for attempt in range(max_retries):
+        s = None
         try:
-            logging.info(f"Sending APRS packet (attempt {attempt+1}/{max_retries})")
+            logging.info("Sending %s APRS packet(s) (attempt %s/%s)", len(packets), attempt + 1, max_retries)
 
             # start the aprs server socket
-            s = socket(AF_INET, SOCK_STREAM)
-            s.settimeout(30)  # Set timeout to 30 seconds
-            s.connect((host, port))
+            s = connect_aprs(config)
+            # Don't let Nagle's algorithm delay our small writes
+            s.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
 
-            # aprs login
-            login_string = f"user {user} pass {passcode} vers aprs-is-wx.py\n"
-            s.send(login_string.encode())
+            # aprs login followed by the packets, written in one go
+            prefix = config["CALLSIGN_PREFIX_BYTES"]
+            s.sendall(config["LOGIN_BYTES"] + b"".join(prefix + packet.encode() + b"\n" for packet in packets))
 
-            # send packet
-            packet_string = f"{callsign}>APRS:{wx}\n"
-            s.send(packet_string.encode())
+            # The whole batch is out, so errors from here on must not trigger a resend
+            try:
+                # Wait for the server to acknowledge instead of sleeping blindly
+                wait_for_server_ack(s, callsign, expected=len(packets))
 
-            # Give server time to process
-            time.sleep(3)
+                # Graceful shutdown
+                s.shutdown(SHUT_RDWR)
+            except (SocketTimeout, OSError) as e:
+                logging.warning("Error closing connection after sending: %s", e)
+            finally:
+                s.close()
 
-            # Graceful shutdown
-            s.shutdown(SHUT_RDWR)
-            s.close()
-
-            logging.info(f"Successfully sent APRS packet")
+            logging.info("Successfully sent APRS packet(s)")
             return True
 
-        except (timeout, error, ConnectionRefusedError, ConnectionResetError) as e:
-            logging.error(f"Network error on attempt {attempt+1}: {e}")
+        except (SocketTimeout, OSError, ConnectionRefusedError, ConnectionResetError) as e:
+            logging.error("Network error on attempt %s: %s", attempt + 1, e)
+            if s is not None:
+                s.close()
+
+            # Resolve the host name again on the next attempt
+            _ADDRINFO_CACHE.pop((config["APRS_HOST"], config["APRS_PORT"]), None)
 
             if attempt < max_retries - 1:
-                logging.info(f"Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
+                # Exponential backoff with jitter, so clients don't retry in lockstep
+                delay = min(60, retry_delay * (1 << attempt)) * (0.5 + random.random())
+                logging.info("Retrying in %.1f seconds...", delay)
+                time.sleep(delay)
             else:
-                logging.error(f"Failed to send APRS packet after {max_retries} attempts")
+                logging.error("Failed to send APRS packet(s) after %s attempts", max_retries)
                 return False
 
         except Exception as e:
-            logging.error(f"Unexpected error: {e}")
+            logging.error("Unexpected error: %s", e)
+            if s is not None:
+                s.close()
             return False
 
 
+def send_aprs_http(config, packets, connect_timeout=5, response_timeout=30):
+    """
+    Send APRS packets via HTTP POST to the APRS-IS HTTP submit port.
+
+    The HTTP response acknowledges each packet, so no waiting for the server
+    is needed. All packets reuse one keep-alive connection. Falls back to the
+    TCP submitter if the HTTP port can't be connected to or answers with a
+    server error (5xx). A packet whose request went out without a clear answer
+    may have been accepted, so it is never resent.
+
+    Args:
+        config (dict): Configuration containing APRS server information
+        packets (list): APRS weather packets and/or status messages
+        connect_timeout (float): Timeout for connecting to the HTTP port in seconds
+        response_timeout (float): Timeout for the server response in seconds
+
+    Returns:
+        bool: True if sending was successful, False otherwise
+    """
+    host = config["APRS_HOST"]
+    port = config["APRS_HTTP_PORT"]
+    login_and_prefix = config["LOGIN_BYTES"] + config["CALLSIGN_PREFIX_BYTES"]
+    headers = {"Content-Type": "application/octet-stream", "Accept-Type": "text/plain"}
+
+    conn = http.client.HTTPConnection(host, port, timeout=connect_timeout)
+    try:
+        for sent, packet in enumerate(packets):
+            # (Re)connect explicitly: the server may close the connection after
+            # any response, and http.client would otherwise reconnect silently
+            if conn.sock is None:
+                try:
+                    conn.connect()
+                except (SocketTimeout, OSError) as e:
+                    logging.warning("Could not connect to HTTP port %s:%s: %s, falling back to TCP", host, port, e)
+                    return send_aprs_with_retry(config, packets[sent:])
+                conn.sock.settimeout(response_timeout)
+
+            body = login_and_prefix + packet.encode() + b"\n"
+            logging.info("Sending APRS packet via HTTP to %s:%s", host, port)
+            try:
+                conn.request("POST", "/", body=body, headers=headers)
+                response = conn.getresponse()
+                response.read()
+            except (SocketTimeout, OSError, http.client.HTTPException) as e:
+                logging.error("HTTP submission failed, packet may not have been delivered: %s", e)
+                return False
+
+            if response.status >= 500:
+                logging.warning("HTTP server error %s %s, falling back to TCP", response.status, response.reason)
+                return send_aprs_with_retry(config, packets[sent:])
+            if response.status >= 300:
+                logging.error("HTTP submission rejected: %s %s", response.status, response.reason)
+                return False
+
+        logging.info("Successfully sent APRS packet(s) via HTTP")
+        return True
+
+    finally:
+        conn.close()
+
+
+class AprsClient:
+    """
+    Long-lived, logged-in APRS-IS connection.
+
+    The connection is opened on first use and transparently re-established
+    when the server drops it, so many packets can be sent without a TCP
+    handshake and login for each one.
+    """
+
+    # APRS-IS servers drop clients that stay silent for too long
+    KEEPALIVE_INTERVAL = 20 * 60
+
+    def __init__(self, config):
+        self.config = config
+        self.sock = None
+        self.connected = False
+        self.last_send = 0.0
+
+    def connect(self):
+        """
+        Connect and log in to the APRS-IS server.
+        """
+        self.close()
+        self.sock = connect_aprs(self.config)
+        # Don't let Nagle's algorithm delay our small writes
+        self.sock.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
+        self.sock.sendall(self.config["LOGIN_BYTES"])
+        self.connected = True
+        self.last_send = time.monotonic()
+        logging.info("Connected to APRS-IS server %s", self.sock.getpeername()[0])
+
+    def send(self, packet):
+        """
+        Send one APRS packet, reconnecting if needed.
+
+        Args:
+            packet (str): APRS weather packet or status message
+        """
+        self._send_bytes(self.config["CALLSIGN_PREFIX_BYTES"] + packet.encode() + b"\n")
+
+    def keepalive(self):
+        """
+        Send a comment line if nothing was sent for KEEPALIVE_INTERVAL seconds.
+        """
+        if self.connected and time.monotonic() - self.last_send >= self.KEEPALIVE_INTERVAL:
+            logging.debug("Sending keepalive")
+            self._send_bytes(b"#keepalive\n")
+
+    def close(self):
+        """
+        Close the connection, if open.
+        """
+        if self.sock is not None:
+            try:
+                self.sock.shutdown(SHUT_RDWR)
+            except OSError:
+                pass
+            self.sock.close()
+        self.sock = None
+        self.connected = False
+
+    def _drain(self):
+        """
+        Discard whatever the server sent since the last call.
+
+        The server periodically sends its own comment lines; reading them keeps
+        the receive buffer from filling up and detects a closed connection.
+
+        Raises:
+            ConnectionResetError: If the server closed the connection
+        """
+        self.sock.setblocking(False)
+        try:
+            while True:
+                data = self.sock.recv(4096)
+                if not data:
+                    raise ConnectionResetError("Connection closed by server")
+        except BlockingIOError:
+            pass
+        finally:
+            self.sock.settimeout(30)
+
+    def _send_bytes(self, data):
+        # Reconnect once on a dropped connection, then give up until the next call
+        for attempt in range(2):
+            try:
+                if not self.connected:
+                    self.connect()
+                self._drain()
+                self.sock.sendall(data)
+                self.last_send = time.monotonic()
+                return
+            except (SocketTimeout, OSError) as e:
+                logging.warning("APRS-IS connection lost: %s", e)
+                self.close()
+                if attempt:
+                    # Resolve the host name again on the next call
+                    _ADDRINFO_CACHE.pop((self.config["APRS_HOST"], self.config["APRS_PORT"]), None)
+                    raise
+
+
 def uptime():
     """
     Get the system uptime.
@@ -363,55 +666,197 @@ def uptime():
         ValueError: If the uptime format is invalid
     """
     try:
-        with open("/proc/uptime", "r") as f:
-            uptime_seconds = float(f.readline().split()[0])
-            uptime_string = str(timedelta(seconds=uptime_seconds))
-
-        logging.debug(f"System uptime: {uptime_string}")
+        fd = os.open("/proc/uptime", os.O_RDONLY)
+        try:
+            buf = os.read(fd, 64)
+        finally:
+            os.close(fd)
+
+        # First field is the uptime in seconds; format like timedelta, without fractions
+        uptime_seconds = int(float(buf[: buf.index(b" ")]))
+        days, rem = divmod(uptime_seconds, 86400)
+        hours, rem = divmod(rem, 3600)
+        minutes, seconds = divmod(rem, 60)
+        uptime_string = f"{hours}:{minutes:02d}:{seconds:02d}"
+        if days:
+            uptime_string = f"{days} day{'s' if days != 1 else ''}, {uptime_string}"
+
+        logging.debug("System uptime: %s", uptime_string)
         return uptime_string
 
     except FileNotFoundError:
         logging.error("Could not read uptime from /proc/uptime")
         raise
     except ValueError as e:
-        logging.error(f"Error parsing uptime: {e}")
+        logging.error("Error parsing uptime: %s", e)
         raise
 
 
-def main():
+def build_packets(config, include_link=None):
+    """
+    Build the weather packet and the accompanying status packets.
+
+    Args:
+        config (dict): Configuration containing station information
+        include_link (bool, optional): Whether to add the link beacon. By default it is
+            added at minutes 15 and 45, which suits runs started by cron.
+
+    Returns:
+        list: APRS packets to send, weather packet first
+    """
+    # Get weather data
+    weather_data = get_wx_data(config["METEO_FILE"], config["ELEVATION"])
+
+    # Create weather packet with all available data
+    wx = make_aprs_wx(config, weather_data)
+
+    # Log the packet
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+    logging.info("%s - Weather packet: %s", timestamp, wx)
+
+    packets = [wx]
+
+    # Add uptime status
     try:
-        # Load configuration
-        config = load_config()
+        status = f">Uptime: {uptime()}"
+        logging.info("Sending status: %s", status)
+        packets.append(status)
+    except Exception as e:
+        logging.error("Error reading uptime status: %s", e)
 
-        # Get weather data
-        weather_data = get_wx_data(config["METEO_FILE"], config["ELEVATION"])
+    if include_link is None:
+        current_minute = datetime.now().minute
+        include_link = current_minute == 15 or current_minute == 45
 
-        # Create weather packet with all available data
-        wx = make_aprs_wx(config, weather_data)
+    if include_link:
+        # send link every 30 minutes
+        logging.info("Sending link: %s", link)
+        packets.append(link)
 
-        # Log the packet
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-        logging.info(f"{timestamp} - Weather packet: {wx}")
+    return packets
 
-        # Send weather data
-        if send_aprs_with_retry(config, wx):
-            # Send uptime status
-            try:
-                status = f">Uptime: {uptime()}"
-                logging.info(f"Sending status: {status}")
-                send_aprs_with_retry(config, status)
 
-                current_minute = datetime.now().minute
-                if current_minute == 15 or current_minute == 45:
-                    # send link every 30 minutes
-                    logging.info(f"Sending link: {link}")
-                    send_aprs_with_retry(config, link)
+def run_daemon(config, interval):
+    """
+    Send weather packets every interval seconds over one long-lived APRS-IS connection.
+
+    The configuration is reloaded before each packet, so edits take effect
+    without a restart. The link beacon goes out with the first packet and then
+    every LINK_INTERVAL seconds.
+
+    Args:
+        config (dict): Initial configuration containing station and APRS server information
+        interval (int): Time between weather packets in seconds
+
+    Returns:
+        int: Exit code
+    """
+    client = AprsClient(config)
+    # Beacon times depend on when the daemon started, so track the link interval directly
+    last_link = None
+    try:
+        while True:
+            next_run = time.monotonic() + interval
+
+            # Cheap when the file is unchanged, load_config caches it by mtime
+            try:
+                new_config = load_config()
+                if new_config is not config:
+                    logging.info("Configuration changed, reconnecting")
+                    config = client.config = new_config
+                    client.close()
+            except Exception as e:
+                logging.error("Error reloading configuration, keeping the previous one: %s", e)
 
+            try:
+                include_link = last_link is None or time.monotonic() - last_link >= LINK_INTERVAL
+                for packet in build_packets(config, include_link):
+                    client.send(packet)
+                if include_link:
+                    last_link = time.monotonic()
+                logging.info("Successfully sent APRS packet(s)")
             except Exception as e:
-                logging.error(f"Error sending uptime status: {e}")
+                logging.error("Error sending APRS packets: %s", e)
+
+            # Sleep until the next beacon, keeping the connection alive meanwhile
+            remaining = next_run - time.monotonic()
+            while remaining > 0:
+                time.sleep(min(remaining, AprsClient.KEEPALIVE_INTERVAL))
+                try:
+                    client.keepalive()
+                except Exception as e:
+                    logging.error("Error sending keepalive: %s", e)
+                remaining = next_run - time.monotonic()
+
+    except KeyboardInterrupt:
+        logging.info("Interrupted, exiting")
+        return 0
+    finally:
+        client.close()
+
+
+def interval_seconds(value):
+    """
+    Parse the daemon interval, rejecting values that would flood APRS-IS.
+
+    Args:
+        value (str): Interval in seconds as given on the command line
+
+    Returns:
+        int: Interval in seconds
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer of at least MIN_INTERVAL
+    """
+    try:
+        interval = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid interval: {value!r}")
+    if interval < MIN_INTERVAL:
+        raise argparse.ArgumentTypeError(f"interval must be at least {MIN_INTERVAL} seconds")
+    return interval
+
+
+def parse_args(argv=None):
+    """
+    Parse command line arguments.
+
+    Args:
+        argv (list, optional): Arguments to parse, defaults to sys.argv[1:]
+
+    Returns:
+        argparse.Namespace: Parsed arguments with daemon and interval attributes
+    """
+    parser = argparse.ArgumentParser(description="Submit APRS weather packets to APRS-IS")
+    parser.add_argument(
+        "--daemon", action="store_true", help="keep running and reuse one APRS-IS connection for all packets"
+    )
+    parser.add_argument(
+        "--interval",
+        type=interval_seconds,
+        default=300,
+        help=f"seconds between weather packets in daemon mode (default: 300, minimum: {MIN_INTERVAL})",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    try:
+        # Load configuration
+        config = load_config()
+
+        if args.daemon:
+            return run_daemon(config, args.interval)
+
+        packets = build_packets(config)
+
+        # Send weather data and status in a single session
+        send_aprs_http(config, packets)
 
     except Exception as e:
-        logging.error(f"Program execution failed: {e}")
+        logging.error("Program execution failed: %s", e)
         return 1
 
     return 0